@@ -1,19 +1,39 @@
+from concurrent.futures import Executor, Future, ThreadPoolExecutor, as_completed
+from typing import Optional
 import maven
 
 
-def dump_dependencies(pkg: maven.MavenPackage, indent: int = 0, processed: set[maven.MavenPackage] = set()):
-    for dep in pkg.get_dependencies():
-        if dep.scope.lower() == "compile" and (not dep.optional) and dep not in processed:
-            print("    " * indent, end="")
-            print(dep)
-            processed.add(dep)
-            dump_dependencies(dep, indent + 1)
+def should_include(dep: maven.MavenDependencyPackage) -> bool:
+    return dep.scope.lower() == "compile" and (not dep.optional)
+
+
+def get_included_dependencies(pkg: maven.MavenPackage) -> list[maven.MavenDependencyPackage]:
+    return [dep for dep in pkg.get_dependencies() if should_include(dep)]
 
-def walk_dependencies(pkg: maven.MavenPackage, indent: int = 0, processed: set[maven.MavenPackage] = set()):
-    for dep in pkg.get_dependencies():
-        if dep.scope.lower() == "compile" and (not dep.optional) and dep not in processed:
-            processed.add(dep)
-            walk_dependencies(dep, indent + 1)
+
+def dump_dependencies(pkg: maven.MavenPackage, indent: int = 0, processed: Optional[set[maven.MavenPackage]] = None, executor: Optional[Executor] = None):
+    if processed == None:
+        processed = set()
+
+    def fetch(dep: maven.MavenPackage) -> Optional[Future]:
+        # with an executor, the poms are fetched in the background while the walk goes on
+        if executor == None:
+            return None
+        return executor.submit(get_included_dependencies, dep)
+
+    # explicit stack instead of recursion, children are pushed reversed to keep the pom order
+    stack: list[tuple[maven.MavenPackage, int, Optional[Future]]] = [
+        (dep, indent, fetch(dep)) for dep in reversed(get_included_dependencies(pkg))
+    ]
+    while len(stack) > 0:
+        dep, depth, future = stack.pop()
+        if dep in processed:
+            continue
+        print("    " * depth, end="")
+        print(dep)
+        processed.add(dep)
+        children = future.result() if future != None else get_included_dependencies(dep)
+        stack.extend((child, depth + 1, fetch(child)) for child in reversed(children))
 
 
 def main():
@@ -26,14 +46,18 @@ def main():
             pkg.version
         )
     )
-    dump_dependencies(pkg, 0, depset)
-    print("================")
-    print("dep count:", len(depset))
-    for dep in depset:
-        print(dep)
-        dep.cache_jar("")
-        dep.cache_jar("-javadoc")
-        dep.cache_jar("-sources")
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        dump_dependencies(pkg, 0, depset, executor)
+        print("================")
+        print("dep count:", len(depset))
+        futures = list()
+        for dep in depset:
+            print(dep)
+            for postfix in ("", "-javadoc", "-sources"):
+                # cache_jar skips jars that are already cached
+                futures.append(executor.submit(dep.cache_jar, postfix))
+        for future in as_completed(futures):
+            future.result()
 
 
 if __name__ == "__main__":
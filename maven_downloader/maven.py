@@ -1,8 +1,26 @@
+from contextlib import contextmanager
+from json import dump as json_dump, load as json_load
+from shutil import copyfileobj
+from sys import intern
+from threading import Lock
+from typing import Optional
+from urllib.error import URLError
 from urllib.parse import quote as parse_url
 from urllib.request import Request, urlopen, HTTPError
-from xml.etree import ElementTree as ET
-from os import getcwd, makedirs
+from re import compile as re_compile
+from os import getcwd, makedirs, remove, replace, stat
 from os import path as os_path
+try:
+    from lxml import etree as ET
+    HAS_LXML = True
+except ImportError:
+    from xml.etree import ElementTree as ET
+    HAS_LXML = False
+try:
+    import urllib3
+    HAS_URLLIB3 = True
+except ImportError:
+    HAS_URLLIB3 = False
 
 CACHE_DIR = os_path.join(getcwd(), ".mvn_cache")
 CACHE_METADATA_DIR = os_path.join(CACHE_DIR, "metadata")
@@ -12,6 +30,26 @@ DEFAULT_REPO_BASE = "https://repo1.maven.org/maven2"
 DEFAULT_VERSION = "release"
 DEFAULT_SCOPE = "compile"
 DEFAULT_OPTIONAL = False
+# bump when the layout of the cached dependency lists changes
+DEPS_CACHE_SCHEMA = 1
+
+PROPERTY_PATTERN = re_compile(r"\$\{([^}]+)\}")
+# properties may refer to other properties, but never expand more than this
+PROPERTY_MAX_DEPTH = 10
+
+# dependency rows of every parsed pom, keyed by (groupId, artifactId, version)
+_DEPS_CACHE: dict[tuple[str, str, str], tuple[tuple[str, str, str, str, bool], ...]] = dict()
+
+_cache_path_locks: dict[str, Lock] = dict()
+_cache_path_locks_guard = Lock()
+# (latest, release, versions) of every metadata file read by this process, keyed by url
+_METADATA_CACHE: dict[str, tuple[Optional[str], Optional[str], tuple[str, ...]]] = dict()
+# urls already revalidated by this process, each one is checked at most once per run
+_revalidated_urls: set[str] = set()
+
+if HAS_URLLIB3:
+    # one pool for all requests, so connections to the repo are kept alive and reused
+    _HTTP = urllib3.PoolManager(maxsize=16, retries=urllib3.Retry(total=3, backoff_factor=0.3))
 
 
 def get_package_page_url(repo_base: str, groupId: str, artifactId: str) -> str:
@@ -54,6 +92,10 @@ def get_pom_cache_path(groupId: str, artifactId: str, version: str):
     return os_path.join(CACHE_POM_DIR, groupId, artifactId, f"{artifactId}-{version}.pom")
 
 
+def get_deps_cache_path(groupId: str, artifactId: str, version: str):
+    return get_pom_cache_path(groupId, artifactId, version) + ".deps.json"
+
+
 def get_jar_cache_path(groupId: str, artifactId: str, version: str, postfix: str = ""):
     groupId = _quote_groupId_path(groupId)
     artifactId = _quote_artifactId_path(artifactId)
@@ -61,18 +103,213 @@ def get_jar_cache_path(groupId: str, artifactId: str, version: str, postfix: str
     return os_path.join(CACHE_JAR_DIR, f"{artifactId}-{version}{postfix}.jar")
 
 
+def _get_cache_path_lock(cache_path: str) -> Lock:
+    # one lock per cache file, so concurrent downloads of the same file are serialized
+    with _cache_path_locks_guard:
+        return _cache_path_locks.setdefault(cache_path, Lock())
+
+
+class _PooledResponse:
+    """Streaming response from the urllib3 pool, used like the one `urlopen` returns."""
+
+    def __init__(self, resp) -> None:
+        self._resp = resp
+        self.headers = resp.headers
+
+    def read(self, size: int = -1) -> bytes:
+        return self._resp.read(size if size >= 0 else None)
+
+    def __enter__(self) -> '_PooledResponse':
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type == None:
+            # hand the connection back to the pool
+            self._resp.drain_conn()
+            self._resp.release_conn()
+        else:
+            self._resp.close()
+
+
+def fetch_stream(url: str, headers: Optional[dict[str, str]] = None):
+    # caller is responsible for closing the response
+    if headers == None:
+        headers = dict()
+    if not HAS_URLLIB3:
+        return urlopen(Request(url, headers=headers))
+    try:
+        resp = _HTTP.request("GET", url, headers=headers, preload_content=False)
+    except urllib3.exceptions.HTTPError as e:
+        raise URLError(e)
+    if resp.status >= 300:
+        # raise the same error as urlopen does
+        resp.drain_conn()
+        resp.release_conn()
+        raise HTTPError(url, resp.status, resp.reason, resp.headers, None)
+    return _PooledResponse(resp)
+
+
 def fetch_url(url: str) -> str:
-    req = Request(url)
-    with urlopen(req) as resp:
+    with fetch_stream(url) as resp:
         return resp.read().decode("utf-8")
 
 
 def fetch_file(url: str) -> bytes:
-    req = Request(url)
-    with urlopen(req) as resp:
+    with fetch_stream(url) as resp:
         return resp.read()
 
 
+def _remove_if_exists(path: str):
+    try:
+        remove(path)
+    except FileNotFoundError:
+        pass
+
+
+def fetch_file_to(url: str, path: str, chunk: int = 65536):
+    # write to a temporary file first, so an interrupted download never looks cached
+    tmp_path = path + ".tmp"
+    try:
+        with fetch_stream(url) as resp, open(tmp_path, "wb") as f:
+            copyfileobj(resp, f, chunk)
+    except BaseException:
+        _remove_if_exists(tmp_path)
+        raise
+    replace(tmp_path, path)
+
+
+class _TeeReader:
+    """Readable wrapper that copies every chunk read from `src` into `dst`."""
+
+    def __init__(self, src, dst) -> None:
+        self._src = src
+        self._dst = dst
+
+    def read(self, size: int = -1) -> bytes:
+        data = self._src.read(size)
+        self._dst.write(data)
+        return data
+
+
+def _get_validators_path(cache_path: str):
+    return cache_path + ".validators.json"
+
+
+def _load_validators(cache_path: str) -> dict[str, str]:
+    try:
+        with open(_get_validators_path(cache_path), "rt", encoding="utf-8") as f:
+            return json_load(f)
+    except (OSError, ValueError):
+        return dict()
+
+
+def _save_validators(cache_path: str, resp):
+    validators: dict[str, str] = dict()
+    if resp.headers.get("ETag") != None:
+        validators["ETag"] = resp.headers["ETag"]
+    if resp.headers.get("Last-Modified") != None:
+        validators["Last-Modified"] = resp.headers["Last-Modified"]
+    with open(_get_validators_path(cache_path), "wt", encoding="utf-8") as f:
+        json_dump(validators, f)
+
+
+def _fetch_if_modified(url: str, cache_path: str):
+    # conditional GET, returns None if the cached copy is still usable
+    validators = _load_validators(cache_path)
+    headers: dict[str, str] = dict()
+    if "ETag" in validators:
+        headers["If-None-Match"] = validators["ETag"]
+    if "Last-Modified" in validators:
+        headers["If-Modified-Since"] = validators["Last-Modified"]
+    try:
+        return fetch_stream(url, headers)
+    except HTTPError as e:
+        if e.code == 304:
+            # not modified
+            return None
+        if e.code >= 500:
+            # the repo is temporarily unavailable, keep using the cached copy
+            return None
+        raise
+    except URLError:
+        # the repo is unreachable, keep using the cached copy
+        return None
+
+
+@contextmanager
+def open_cached_stream(url: str, cache_path: str, revalidate: bool = False):
+    """Open `cache_path` as a binary stream, downloading it from `url` on a cache miss.
+
+    On a miss the response is written to the cache while it is being read,
+    so the content is never held in memory as a whole. With `revalidate`, a
+    cached copy is checked against the repo with a conditional GET first.
+    """
+    with _get_cache_path_lock(cache_path):
+        resp = None
+        # open directly instead of checking for existence first, saves a stat per hit
+        try:
+            cached = open(cache_path, "rb")
+        except FileNotFoundError:
+            cached = None
+        if cached != None:
+            if revalidate and url not in _revalidated_urls:
+                try:
+                    resp = _fetch_if_modified(url, cache_path)
+                except BaseException:
+                    cached.close()
+                    raise
+                _revalidated_urls.add(url)
+            if resp == None:
+                # load from cache
+                with cached:
+                    yield cached
+                return
+            cached.close()
+        else:
+            resp = fetch_stream(url)
+        # load from remote repo
+        makedirs(os_path.dirname(cache_path), exist_ok=True)
+        tmp_path = cache_path + ".tmp"
+        try:
+            with resp, open(tmp_path, "wb") as f:
+                yield _TeeReader(resp, f)
+                # save whatever the reader did not consume
+                copyfileobj(resp, f)
+        except BaseException:
+            _remove_if_exists(tmp_path)
+            raise
+        replace(tmp_path, cache_path)
+        if revalidate:
+            _save_validators(cache_path, resp)
+            _revalidated_urls.add(url)
+
+
+def xml_parse(stream) -> ET.Element:
+    if HAS_LXML:
+        return ET.parse(stream, ET.XMLParser(huge_tree=True, recover=True)).getroot()
+    return ET.parse(stream).getroot()
+
+
+def xml_iterparse(stream, events: tuple[str, ...]):
+    if HAS_LXML:
+        return ET.iterparse(stream, events=events, huge_tree=True, recover=True)
+    return ET.iterparse(stream, events=events)
+
+
+def xml_release(elem: ET.Element):
+    # free an element that has been fully processed during iterparse
+    elem.clear()
+    if HAS_LXML:
+        # lxml keeps the cleared element, drop it together with the earlier siblings
+        while elem.getprevious() is not None:
+            del elem.getparent()[0]
+
+
+def is_xml_element(node: ET.Element) -> bool:
+    # lxml also yields comments and processing instructions, their tag is not a str
+    return isinstance(node.tag, str)
+
+
 def tag_strip_namespace(tag: str):
     if tag.startswith("{"):
         tag = tag.split("}")[1]
@@ -80,34 +317,33 @@ def tag_strip_namespace(tag: str):
 
 
 def parse_property_value(properties: dict[str, str], text: str):
-    idx = text.find("${")
-    while idx >= 0:
-        end = text.find("}")
-        name = text[idx + 2:end]
-        replacement = properties.get(name, "")
-        text_head = text[0:idx]
-        text_tail = text[end + 1:]
-        text = text_head + replacement + text_tail
-        # find next
-        idx = text.find("${")
+    def replace_property(match):
+        return properties.get(match.group(1), "")
+    for _ in range(PROPERTY_MAX_DEPTH):
+        expanded = PROPERTY_PATTERN.sub(replace_property, text)
+        if expanded == text:
+            break
+        text = expanded
     return text
 
 
 class MavenPackageMeta:
+    __slots__ = ("groupId", "artifactId", "repo", "_base_url")
+
     def __init__(self, groupId: str, artifactId: str, repo: str = DEFAULT_REPO_BASE) -> None:
-        self.groupId = groupId
-        self.artifactId = artifactId
-        self.repo = repo
+        # the same ids repeat across the whole graph, share one string object for each
+        self.groupId = intern(groupId)
+        self.artifactId = intern(artifactId)
+        self.repo = intern(repo)
         self._base_url = get_package_page_url(repo, groupId, artifactId)
-        self._metadata_cache = ""
 
     def __eq__(self, value: object) -> bool:
         if not isinstance(value, MavenPackageMeta):
             return False
-        return (self.groupId == value.groupId) and (self.artifactId == value.groupId)
+        return (self.groupId, self.artifactId, self.repo) == (value.groupId, value.artifactId, value.repo)
 
     def __hash__(self) -> int:
-        return hash(self.groupId) + hash(self.artifactId)
+        return hash((self.groupId, self.artifactId, self.repo))
 
     def __repr__(self) -> str:
         if self.repo == DEFAULT_REPO_BASE:
@@ -115,50 +351,67 @@ class MavenPackageMeta:
         else:
             return f"MavenPackageMeta('{self.groupId}', '{self.artifactId}', '{self.repo}')"
 
+    def _get_metadata_url(self) -> str:
+        return f"{self._base_url}/maven-metadata.xml"
+
     def _get_metadata(self) -> ET.Element:
         cache_path = get_metadata_cache_path(self.groupId, self.artifactId)
-        if len(self._metadata_cache) > 0:
-            pass  # using cache
-        elif os_path.exists(cache_path):
-            # load from cache
-            with open(cache_path, "rt", encoding="utf-8") as f:
-                self._metadata_cache = f.read()
-        else:
-            # load from remote repo
-            url = f"{self._base_url}/maven-metadata.xml"
-            content = fetch_url(url)
-            if len(content) > 0:
-                self._metadata_cache = content
-                # save cache
-                makedirs(os_path.dirname(cache_path), exist_ok=True)
-                with open(cache_path, "wt", encoding="utf-8") as f:
-                    f.write(content)
-        # process xml
-        return ET.fromstring(self._metadata_cache)
+        with open_cached_stream(self._get_metadata_url(), cache_path, revalidate=True) as stream:
+            return xml_parse(stream)
+
+    def _get_versioning(self) -> tuple[Optional[str], Optional[str], tuple[str, ...]]:
+        # shared by every meta of the same package, so each file is parsed once per process
+        url = self._get_metadata_url()
+        if url in _METADATA_CACHE:
+            return _METADATA_CACHE[url]
+        # keyed by url, the cache file itself is locked by open_cached_stream
+        with _get_cache_path_lock(url):
+            if url not in _METADATA_CACHE:
+                _METADATA_CACHE[url] = self._parse_versioning()
+        return _METADATA_CACHE[url]
+
+    def _parse_versioning(self) -> tuple[Optional[str], Optional[str], tuple[str, ...]]:
+        latest = release = None
+        versions: tuple[str, ...] = tuple()
+        # only /metadata/versioning is needed, walk down to it instead of searching the tree
+        for versioning in self._get_metadata():
+            if not is_xml_element(versioning) or tag_strip_namespace(versioning.tag) != "versioning":
+                continue
+            for elem in versioning:
+                if not is_xml_element(elem):
+                    continue
+                tag = tag_strip_namespace(elem.tag)
+                if tag == "latest":
+                    latest = elem.text
+                elif tag == "release":
+                    release = elem.text
+                elif tag == "versions":
+                    versions = tuple(
+                        version.text for version in elem
+                        if is_xml_element(version) and tag_strip_namespace(version.tag) == "version"
+                    )
+            break
+        return (latest, release, versions)
 
     def get_latest_version(self) -> str:
-        root = self._get_metadata()
-        for elem in root.iterfind(".//{*}latest"):
-            return elem.text
+        return self._get_versioning()[0]
 
     def get_release_version(self) -> str:
-        root = self._get_metadata()
-        for elem in root.iterfind(".//{*}release"):
-            return elem.text
+        return self._get_versioning()[1]
 
     def get_versions(self) -> list[str]:
-        root = self._get_metadata()
-        return [elem.text for elem in root.iterfind(".//{*}version")]
+        return list(self._get_versioning()[2])
 
     def get_package(self, version: str = DEFAULT_VERSION):
         return MavenPackage(self, version)
 
 
 class MavenPackage:
+    __slots__ = ("_version", "meta", "_version_is_unsure")
+
     def __init__(self, meta: MavenPackageMeta, version: str = DEFAULT_VERSION) -> None:
         self._version = version
         self.meta = meta
-        self._pom_cache = ""
         self._version_is_unsure = False
         if version == None or version.lower().strip() in ("latest", "release", DEFAULT_VERSION, ""):
             self._version_is_unsure = True
@@ -181,7 +434,7 @@ class MavenPackage:
         return (self.meta == value.meta) and (self._get_version() == value._get_version())
 
     def __hash__(self) -> int:
-        return hash(self.meta) + hash(self._get_version())
+        return hash((self.meta, self._get_version()))
 
     def _get_version(self):
         if self._version == None or len(self._version.strip()) <= 0:
@@ -196,92 +449,153 @@ class MavenPackage:
         version = self._get_version()
         return f"{self.meta._base_url}/{version}/{self.meta.artifactId}-{version}{postfix}"
 
-    def _get_pom(self):
+    def _open_pom(self):
         cache_path = get_pom_cache_path(
             self.meta.groupId, self.meta.artifactId, self._get_version())
-        if len(self._pom_cache) > 0:
-            pass  # using cache
-        elif os_path.exists(cache_path):
-            # load from cache
-            with open(cache_path, "rt", encoding="utf-8") as f:
-                self._pom_cache = f.read()
-        else:
-            url = self._get_package_file_url(".pom")
-            content = fetch_url(url)
-            if len(content) > 0:
-                self._pom_cache = content
-                # save cache
-                makedirs(os_path.dirname(cache_path), exist_ok=True)
-                with open(cache_path, "wt", encoding="utf-8") as f:
-                    f.write(content)
-        # process xml
-        return ET.fromstring(self._pom_cache)
+        url = self._get_package_file_url(".pom")
+        return open_cached_stream(url, cache_path)
+
+    def _get_key(self) -> tuple[str, str, str]:
+        return (self.meta.groupId, self.meta.artifactId, self._get_version())
 
     def get_dependencies(self) -> list['MavenDependencyPackage']:
-        lst: list['MavenDependencyPackage'] = list()
-        root = self._get_pom()
-        # parse properties
+        key = self._get_key()
+        if key not in _DEPS_CACHE:
+            rows = self._load_dependencies()
+            if rows == None:
+                rows = self._parse_dependencies()
+                self._save_dependencies(rows)
+            _DEPS_CACHE[key] = tuple(rows)
+        # the cache only holds immutable rows, every caller gets its own package objects
+        return [
+            _make_dep(MavenPackageMeta(groupId, artifactId, self.meta.repo), version, scope, optional)
+            for groupId, artifactId, version, scope, optional in _DEPS_CACHE[key]
+        ]
+
+    def _load_dependencies(self) -> Optional[list[tuple[str, str, str, str, bool]]]:
+        # dependency list saved by an earlier run, skips parsing the pom again
+        pom_path = get_pom_cache_path(self.meta.groupId, self.meta.artifactId, self._get_version())
+        deps_path = get_deps_cache_path(self.meta.groupId, self.meta.artifactId, self._get_version())
+        try:
+            if stat(deps_path).st_mtime < stat(pom_path).st_mtime:
+                return None
+            with open(deps_path, "rt", encoding="utf-8") as f:
+                content = json_load(f)
+            if content["schema"] != DEPS_CACHE_SCHEMA:
+                return None
+            return [
+                (str(groupId), str(artifactId), str(version), str(scope), bool(optional))
+                for groupId, artifactId, version, scope, optional in content["dependencies"]
+            ]
+        except (OSError, ValueError, TypeError, KeyError):
+            return None
+
+    def _save_dependencies(self, rows: list[tuple[str, str, str, str, bool]]):
+        deps_path = get_deps_cache_path(self.meta.groupId, self.meta.artifactId, self._get_version())
+        tmp_path = deps_path + ".tmp"
+        with _get_cache_path_lock(deps_path):
+            try:
+                with open(tmp_path, "wt", encoding="utf-8") as f:
+                    json_dump({"schema": DEPS_CACHE_SCHEMA, "dependencies": rows}, f)
+            except BaseException:
+                _remove_if_exists(tmp_path)
+                raise
+            replace(tmp_path, deps_path)
+
+    def _parse_dependencies(self) -> list[tuple[str, str, str, str, bool]]:
+        # (groupId, artifactId, version, scope, optional), version is left unresolved
+        rows: list[tuple[str, str, str, str, bool]] = list()
         properties: dict[str, str] = dict()
-        properties["project.version"] = self._version
+        properties["project.version"] = self._get_version()
         properties["project.groupId"] = self.meta.groupId
         properties["project.artifactId"] = self.meta.artifactId
-        if root.find(".//{*}properties") != None:
-            for prop in root.find(".//{*}properties").iter():
-                tag = tag_strip_namespace(prop.tag)
-                value = prop.text.strip() if prop.text else ""
-                properties[tag] = value
-        # parse deps
-        for dep in root.iterfind(".//{*}dependencies/{*}dependency"):
+        properties_found = False
+        # (groupId, artifactId, version, scope, optional) as written in the pom
+        raw_deps: list[tuple[str, str, Optional[str], Optional[str], Optional[str]]] = list()
+        # stream the pom, releasing every element once it has been consumed
+        path: list[str] = list()
+        with self._open_pom() as stream:
+            for event, elem in xml_iterparse(stream, ("start", "end")):
+                if event == "start":
+                    path.append(tag_strip_namespace(elem.tag))
+                    continue
+                tag = path.pop()
+                if tag == "properties" and not properties_found:
+                    # parse properties
+                    properties_found = True
+                    for prop in elem.iter():
+                        if not is_xml_element(prop):
+                            continue
+                        prop_tag = tag_strip_namespace(prop.tag)
+                        value = prop.text.strip() if prop.text else ""
+                        properties[prop_tag] = value
+                elif tag == "dependency" and len(path) > 0 and path[-1] == "dependencies":
+                    # parse deps
+                    groupId = artifactId = version = dep_scope = dep_optional = None
+                    for child in elem:
+                        if not is_xml_element(child):
+                            continue
+                        child_tag = tag_strip_namespace(child.tag)
+                        if child_tag == "groupId":
+                            groupId = child.text
+                        elif child_tag == "artifactId":
+                            artifactId = child.text
+                        elif child_tag == "version":
+                            version = child.text
+                        elif child_tag == "scope":
+                            dep_scope = child.text
+                        elif child_tag == "optional":
+                            dep_optional = child.text
+                    raw_deps.append((groupId, artifactId, version, dep_scope, dep_optional))
+                elif tag != "dependencies" and len(path) != 1:
+                    continue
+                # children of dependencies and of the project are no longer needed
+                xml_release(elem)
+        for groupId, artifactId, version, dep_scope, dep_optional in raw_deps:
             # id
-            groupId = dep.find("./{*}groupId").text
             groupId = parse_property_value(properties, groupId)
-            artifactId = dep.find("./{*}artifactId").text
             artifactId = parse_property_value(properties, artifactId)
             # version
-            version = DEFAULT_VERSION
-            if dep.find("./{*}version") != None:
-                version = dep.find("./{*}version").text
+            if version != None:
                 version = parse_property_value(properties, version)
             elif groupId == self.meta.groupId:
                 version = self._version
-            pkg = MavenDependencyPackage(
-                MavenPackageMeta(groupId, artifactId, self.meta.repo),
-                version
-            )
+            else:
+                version = DEFAULT_VERSION
             # scope
-            pkg._scope = DEFAULT_SCOPE
-            if dep.find("./{*}scope") != None:
-                pkg._scope = dep.find("./{*}scope").text
+            scope = DEFAULT_SCOPE
+            if dep_scope != None:
+                scope = dep_scope
             # optional
-            if dep.find("./{*}optional") != None:
-                pkg._optional = dep.find(
-                    "./{*}optional").text.lower() == "true"
-            lst.append(pkg)
-        return lst
+            optional = DEFAULT_OPTIONAL
+            if dep_optional != None:
+                optional = dep_optional.lower() == "true"
+            rows.append((groupId, artifactId, version, scope, optional))
+        return rows
 
     def asDependencyPackage(self, optional: bool = DEFAULT_OPTIONAL, scope: str = DEFAULT_SCOPE) -> 'MavenDependencyPackage':
-        pkg = MavenDependencyPackage(
-            self.meta,
-            self._version
-        )
-        pkg._scope = scope
-        pkg._optional = optional
-    
+        return _make_dep(self.meta, self._version, scope, optional)
+
     def cache_jar(self, postfix: str = "") -> bool:
         cache_path = get_jar_cache_path(self.meta.groupId, self.meta.artifactId, self._get_version(), postfix)
-        if not os_path.exists(cache_path):
+        with _get_cache_path_lock(cache_path):
+            try:
+                stat(cache_path)
+                return True
+            except FileNotFoundError:
+                pass
             url = self._get_package_file_url(f"{postfix}.jar")
+            makedirs(os_path.dirname(cache_path), exist_ok=True)
             try:
-                data = fetch_file(url)
+                fetch_file_to(url, cache_path)
             except HTTPError:
                 return False
-            makedirs(os_path.dirname(cache_path), exist_ok=True)
-            with open(cache_path, "wb") as f:
-                f.write(data)
         return True
 
 
 class MavenDependencyPackage(MavenPackage):
+    __slots__ = ("_scope", "_optional")
+
     def __init__(self, meta: MavenPackageMeta, version: str = DEFAULT_VERSION) -> None:
         super().__init__(meta, version)
         self._scope = DEFAULT_SCOPE
@@ -294,3 +608,11 @@ class MavenDependencyPackage(MavenPackage):
     @property
     def optional(self) -> str:
         return self._optional
+
+
+def _make_dep(meta: MavenPackageMeta, version: str, scope: str, optional: bool) -> MavenDependencyPackage:
+    pkg = MavenDependencyPackage(meta, version)
+    pkg._scope = scope
+    pkg._optional = optional
+    return pkg
+